@@ -0,0 +1,17 @@
+"""Shared Firestore client for the common agent modules.
+
+The client is created on first use so importing a module that needs it does
+not open a connection or load credentials.
+"""
+
+from google.cloud import firestore
+
+_db = None
+
+
+def get_firestore_client() -> firestore.Client:
+    """Get Firestore client with lazy initialization."""
+    global _db
+    if _db is None:
+        _db = firestore.Client()
+    return _db
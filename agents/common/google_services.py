@@ -71,7 +71,7 @@ class GoogleServicesHub:
         self.vision_api_key = os.getenv("GOOGLE_VISION_API_KEY")
         self.calendar_credentials_file = os.getenv("GOOGLE_CALENDAR_CREDENTIALS_FILE")
         
-        self.logger.info(f"GoogleServicesHub initialized with mock={use_mock}")
+        self.logger.info("GoogleServicesHub initialized with mock=%s", use_mock)
     
     async def initialize_all_services(self) -> Dict[str, bool]:
         """Initialize all Google Cloud services and return status."""
@@ -86,7 +86,7 @@ class GoogleServicesHub:
             status["speech"] = await self._initialize_speech_service()
             status["vision"] = await self._initialize_vision_service()
             status["calendar"] = await self._initialize_calendar_service()
-            self.logger.info(f"Services initialized: {status}")
+            self.logger.info("Services initialized: %s", status)
         
         return status
     
@@ -98,7 +98,7 @@ class GoogleServicesHub:
             self.logger.info("Google Speech-to-Text client initialized")
             return True
         except Exception as e:
-            self.logger.error(f"Failed to initialize Speech-to-Text: {e}")
+            self.logger.error("Failed to initialize Speech-to-Text: %s", e)
             return False
     
     async def _initialize_vision_service(self) -> bool:
@@ -109,7 +109,7 @@ class GoogleServicesHub:
             self.logger.info("Google Vision API client initialized")
             return True
         except Exception as e:
-            self.logger.error(f"Failed to initialize Vision API: {e}")
+            self.logger.error("Failed to initialize Vision API: %s", e)
             return False
     
     async def _initialize_calendar_service(self) -> bool:
@@ -124,7 +124,7 @@ class GoogleServicesHub:
             self.logger.info("Google Calendar API setup initiated")
             return True
         except Exception as e:
-            self.logger.error(f"Failed to initialize Calendar API: {e}")
+            self.logger.error("Failed to initialize Calendar API: %s", e)
             return False
     
     # Speech-to-Text Methods
@@ -155,8 +155,8 @@ class GoogleServicesHub:
                 language_code=language_code,
             )
             
-            # Perform transcription
-            response = self._speech_client.recognize(config=config, audio=audio)
+            # Perform transcription; the client call blocks, so keep it off the event loop
+            response = await asyncio.to_thread(self._speech_client.recognize, config=config, audio=audio)
             
             # Extract transcription text
             transcript = ""
@@ -166,7 +166,7 @@ class GoogleServicesHub:
             return transcript or "No speech detected"
             
         except Exception as e:
-            self.logger.error(f"Speech transcription failed: {e}")
+            self.logger.error("Speech transcription failed: %s", e)
             return f"Transcription error: {str(e)}"
     
     # Vision API Methods
@@ -191,11 +191,14 @@ class GoogleServicesHub:
             # Prepare image for analysis
             image = vision.Image(content=image_data)
             
-            # Perform object detection to identify food items
-            objects = self._vision_client.object_localization(image=image).localized_object_annotations
-            
-            # Perform label detection for additional food identification
-            labels = self._vision_client.label_detection(image=image).label_annotations
+            # Run object detection (to identify food items) and label detection
+            # (for additional food identification) concurrently off the event loop
+            object_response, label_response = await asyncio.gather(
+                asyncio.to_thread(self._vision_client.object_localization, image=image),
+                asyncio.to_thread(self._vision_client.label_detection, image=image)
+            )
+            objects = object_response.localized_object_annotations
+            labels = label_response.label_annotations
             
             # Extract food-related objects and labels
             detected_foods = []
@@ -229,7 +232,7 @@ class GoogleServicesHub:
             }
             
         except Exception as e:
-            self.logger.error(f"Food image analysis failed: {e}")
+            self.logger.error("Food image analysis failed: %s", e)
             return {
                 "detected_foods": [],
                 "estimated_calories": 0,
@@ -296,7 +299,7 @@ class GoogleServicesHub:
             return f"real_event_placeholder_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
             
         except Exception as e:
-            self.logger.error(f"Calendar event creation failed: {e}")
+            self.logger.error("Calendar event creation failed: %s", e)
             return f"error_event_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
     
     async def get_calendar_events(self, start_date: datetime, end_date: datetime) -> List[Dict[str, Any]]:
@@ -339,47 +342,30 @@ class GoogleServicesHub:
             "services": {}
         }
         
-        # Test each service
-        try:
-            # Test speech service
-            test_audio = b"test audio data"
-            speech_result = await self.transcribe_audio(test_audio)
-            health_status["services"]["speech"] = {
-                "healthy": True,
-                "test_result": "OK" if speech_result else "No response"
-            }
-        except Exception as e:
-            health_status["services"]["speech"] = {"healthy": False, "error": str(e)}
-            health_status["overall_healthy"] = False
+        test_event = {
+            "title": "Health Check Test",
+            "description": "Automated health check",
+            "start_time": datetime.now(),
+            "end_time": datetime.now() + timedelta(minutes=10)
+        }
         
-        try:
-            # Test vision service
-            test_image = b"test image data"
-            vision_result = await self.analyze_food_image(test_image)
-            health_status["services"]["vision"] = {
-                "healthy": True,
-                "test_result": "OK" if vision_result else "No response"
-            }
-        except Exception as e:
-            health_status["services"]["vision"] = {"healthy": False, "error": str(e)}
-            health_status["overall_healthy"] = False
+        # Test each service; the probes are independent, so run them concurrently
+        results = await asyncio.gather(
+            self.transcribe_audio(b"test audio data"),
+            self.analyze_food_image(b"test image data"),
+            self.create_calendar_event(test_event),
+            return_exceptions=True
+        )
         
-        try:
-            # Test calendar service
-            test_event = {
-                "title": "Health Check Test",
-                "description": "Automated health check",
-                "start_time": datetime.now(),
-                "end_time": datetime.now() + timedelta(minutes=10)
-            }
-            calendar_result = await self.create_calendar_event(test_event)
-            health_status["services"]["calendar"] = {
-                "healthy": True,
-                "test_result": "OK" if calendar_result else "No response"
-            }
-        except Exception as e:
-            health_status["services"]["calendar"] = {"healthy": False, "error": str(e)}
-            health_status["overall_healthy"] = False
+        for service, result in zip(("speech", "vision", "calendar"), results):
+            if isinstance(result, BaseException):
+                health_status["services"][service] = {"healthy": False, "error": str(result)}
+                health_status["overall_healthy"] = False
+            else:
+                health_status["services"][service] = {
+                    "healthy": True,
+                    "test_result": "OK" if result else "No response"
+                }
         
         return health_status
 
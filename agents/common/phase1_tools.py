@@ -10,9 +10,12 @@ These are example tools that can be integrated into agents.
 """
 
 import uuid
+import asyncio
 import logging
+from bisect import bisect_left
+from collections import deque
 from typing import Dict, Any, List, Optional
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
 from .tool_results import (
     ExerciseToolResult, 
@@ -22,10 +25,30 @@ from .tool_results import (
 )
 from .google_services import google_services
 from .session_timer import LocalSessionTimer, SessionType
+from .firestore_client import get_firestore_client
 from google.cloud import firestore
+from google.cloud.firestore_v1.base_query import FieldFilter
 
 logger = logging.getLogger(__name__)
 
+# Firestore rejects batched writes with more than 500 operations
+FIRESTORE_BATCH_LIMIT = 500
+
+# Maximum Google Calendar inserts in flight during a bulk schedule creation
+CALENDAR_CONCURRENCY_LIMIT = 10
+
+# Supported schedule event types and the category each is filed under
+_EVENT_CATEGORIES = {
+    "therapy": "wellness",
+    "exercise": "wellness",
+    "journaling": "wellness",
+    "meal": "personal",
+    "sleep": "personal",
+    "study": "personal",
+    "work": "personal",
+    "personal": "personal"
+}
+
 
 # ============================================================================
 # EXERCISE TOOLS (10-minute sessions)
@@ -61,25 +84,27 @@ async def start_exercise_session(
         
         # Store initial exercise record in Firestore
         exercise_id = str(uuid.uuid4())
-        db = firestore.Client()
+        db = get_firestore_client()
         
+        now_iso = datetime.now().isoformat()
         exercise_doc = {
             "exerciseId": exercise_id,
             "sessionId": session_id,
             "type": exercise_type,
             "userId": user_id,
-            "startTime": datetime.now().isoformat(),
+            "startTime": now_iso,
             "duration": 10,  # Fixed 10 minutes
             "status": "active",
             "effectivenessScore": None,
             "notes": "",
-            "createdAt": datetime.now().isoformat(),
-            "updatedAt": datetime.now().isoformat()
+            "createdAt": now_iso,
+            "updatedAt": now_iso
         }
         
-        db.collection("users").document(user_id).collection("exercises").document(exercise_id).set(exercise_doc)
+        exercise_ref = db.collection("users").document(user_id).collection("exercises").document(exercise_id)
+        await asyncio.to_thread(exercise_ref.set, exercise_doc)
         
-        logger.info(f"Exercise session started: {exercise_type} for user {user_id}")
+        logger.info("Exercise session started: %s for user %s", exercise_type, user_id)
         
         return ExerciseToolResult.success_result(
             data={
@@ -95,7 +120,7 @@ async def start_exercise_session(
         )
         
     except Exception as e:
-        logger.error(f"Failed to start exercise session: {e}")
+        logger.error("Failed to start exercise session: %s", e)
         return ExerciseToolResult.error_result(
             message="Failed to start exercise session",
             error_details=str(e)
@@ -128,24 +153,25 @@ async def complete_exercise_session(
             )
         
         # Update exercise record in Firestore
-        db = firestore.Client()
+        db = get_firestore_client()
         exercise_ref = db.collection("users").document(user_id).collection("exercises").document(exercise_id)
         
+        now_iso = datetime.now().isoformat()
         update_data = {
-            "completedAt": datetime.now().isoformat(),
+            "completedAt": now_iso,
             "effectivenessScore": effectiveness_score,
             "notes": notes or "",
             "status": "completed",
-            "updatedAt": datetime.now().isoformat()
+            "updatedAt": now_iso
         }
         
-        exercise_ref.update(update_data)
+        await asyncio.to_thread(exercise_ref.update, update_data)
         
-        logger.info(f"Exercise session completed: {exercise_id} with score {effectiveness_score}")
+        logger.info("Exercise session completed: %s with score %s", exercise_id, effectiveness_score)
         
         return ExerciseToolResult.success_result(
             data={
-                "completion_time": datetime.now().isoformat(),
+                "completion_time": now_iso,
                 "effectiveness_score": effectiveness_score,
                 "notes": notes
             },
@@ -156,7 +182,7 @@ async def complete_exercise_session(
         )
         
     except Exception as e:
-        logger.error(f"Failed to complete exercise session: {e}")
+        logger.error("Failed to complete exercise session: %s", e)
         return ExerciseToolResult.error_result(
             message="Failed to complete exercise session",
             error_details=str(e)
@@ -219,6 +245,28 @@ def _get_exercise_instructions(exercise_type: str) -> Dict[str, Any]:
     return instructions.get(exercise_type, {})
 
 
+def _summarize_exercises(exercises_ref) -> Dict[str, Any]:
+    """Summarize exercise sessions in a single pass over the query stream.
+    
+    Only the five most recent documents are kept in memory, so the summary
+    does not grow with the user's exercise history.
+    """
+    total = 0
+    effectiveness_total = 0
+    recent = deque(maxlen=5)
+    for doc in exercises_ref.stream():
+        exercise = doc.to_dict()
+        total += 1
+        effectiveness_total += exercise.get("effectivenessScore") or 0
+        recent.append(exercise)
+    
+    return {
+        "total_sessions": total,
+        "recent_exercises": list(recent),
+        "average_effectiveness": effectiveness_total / total if total else 0
+    }
+
+
 # ============================================================================
 # SCHEDULING TOOLS (Wellness + General Life)
 # ============================================================================
@@ -248,10 +296,9 @@ async def create_schedule_event(
     """
     try:
         # Validate event type
-        valid_types = ["therapy", "exercise", "journaling", "meal", "sleep", "study", "work", "personal"]
-        if event_type not in valid_types:
+        if event_type not in _EVENT_CATEGORIES:
             return SchedulingToolResult.error_result(
-                message=f"Invalid event type. Must be one of: {valid_types}",
+                message=f"Invalid event type. Must be one of: {list(_EVENT_CATEGORIES)}",
                 error_details=f"Provided: {event_type}"
             )
         
@@ -268,13 +315,15 @@ async def create_schedule_event(
         
         google_event_id = await google_services.create_calendar_event(event_details)
         
-        # Store in Firestore
-        schedule_id = str(uuid.uuid4())
-        db = firestore.Client()
+        # Store in Firestore, letting it generate the document ID locally
+        db = get_firestore_client()
+        schedule_ref = db.collection("users").document(user_id).collection("schedules").document()
+        schedule_id = schedule_ref.id
         
         # Determine category based on event type
-        category = "wellness" if event_type in ["therapy", "exercise", "journaling"] else "personal"
+        category = _EVENT_CATEGORIES[event_type]
         
+        now = datetime.now()
         schedule_doc = {
             "scheduleId": schedule_id,
             "userId": user_id,
@@ -285,16 +334,18 @@ async def create_schedule_event(
             "googleEventId": google_event_id,
             "scheduledTime": start_time,
             "endTime": end_time,
+            "startTs": _to_epoch_seconds(start_time),
+            "endTs": _to_epoch_seconds(end_time),
             "durationMinutes": duration_minutes,
             "frequency": frequency,
             "status": "scheduled",
-            "createdAt": datetime.now(),
-            "updatedAt": datetime.now()
+            "createdAt": now,
+            "updatedAt": now
         }
         
-        db.collection("users").document(user_id).collection("schedules").document(schedule_id).set(schedule_doc)
+        await asyncio.to_thread(schedule_ref.set, schedule_doc)
         
-        logger.info(f"Schedule event created: {title} for user {user_id}")
+        logger.info("Schedule event created: %s for user %s", title, user_id)
         
         return SchedulingToolResult.success_result(
             data={
@@ -311,13 +362,306 @@ async def create_schedule_event(
         )
         
     except Exception as e:
-        logger.error(f"Failed to create schedule event: {e}")
+        logger.error("Failed to create schedule event: %s", e)
         return SchedulingToolResult.error_result(
             message="Failed to create schedule event",
             error_details=str(e)
         )
 
 
+async def create_schedule_events_bulk(
+    user_id: str,
+    events: List[Dict[str, Any]]
+) -> SchedulingToolResult:
+    """Create several scheduled events with batched Firestore writes.
+    
+    All events are validated against each other and against the user's
+    existing schedule before anything is written, then committed in batches
+    of up to 500 documents instead of one round-trip per event. Batches are
+    committed in order; if one fails, the result reports which events were
+    already stored.
+    
+    The existing-schedule check uses a range query on scheduledTime/endTime,
+    which every schedule document has (including those written before the
+    startTs/endTs fields existed) and which needs the composite index in
+    firestore.indexes.json.
+    
+    Args:
+        user_id: User identifier
+        events: Event dictionaries with the same fields as create_schedule_event
+            (title, description, start_time, duration_minutes, event_type, frequency)
+        
+    Returns:
+        SchedulingToolResult with the created schedule IDs
+    """
+    try:
+        if not events:
+            return SchedulingToolResult.error_result(
+                message="No events provided",
+                error_details="events list is empty"
+            )
+        
+        invalid = [event.get("event_type") for event in events if event.get("event_type") not in _EVENT_CATEGORIES]
+        if invalid:
+            return SchedulingToolResult.error_result(
+                message=f"Invalid event type. Must be one of: {list(_EVENT_CATEGORIES)}",
+                error_details=f"Provided: {invalid}"
+            )
+        
+        invalid_durations = [
+            event.get("title") for event in events if (event.get("duration_minutes") or 0) <= 0
+        ]
+        if invalid_durations:
+            return SchedulingToolResult.error_result(
+                message="Event duration must be a positive number of minutes",
+                error_details=f"Invalid duration for: {invalid_durations}"
+            )
+        
+        intervals = [
+            (event["start_time"], event["start_time"] + timedelta(minutes=event["duration_minutes"]))
+            for event in events
+        ]
+        
+        db = get_firestore_client()
+        schedules_ref = db.collection("users").document(user_id).collection("schedules")
+        
+        timestamps = [(_to_epoch_seconds(start), _to_epoch_seconds(end)) for start, end in intervals]
+        
+        # Validate the events against each other before touching Firestore
+        overlaps = _find_overlapping_events(timestamps)
+        if overlaps:
+            return SchedulingToolResult.error_result(
+                message=f"{len(overlaps)} event(s) overlap other events in this request",
+                error_details="; ".join(
+                    f"'{events[index]['title']}' overlaps '{events[other]['title']}'"
+                    for other, index in overlaps[:3]
+                ),
+                next_actions=["choose_different_times"]
+            )
+        
+        # Validate every event against the existing schedule before issuing any writes
+        window_start = min(start for start, _ in timestamps)
+        window_end = max(end for _, end in timestamps)
+        existing_docs = await asyncio.to_thread(
+            _get_overlapping_schedules, schedules_ref, window_start, window_end
+        )
+        conflicts = _find_schedule_conflicts(existing_docs, timestamps)
+        if conflicts:
+            return SchedulingToolResult.error_result(
+                message=f"{len(conflicts)} event(s) conflict with your existing schedule",
+                error_details="; ".join(
+                    f"'{events[index]['title']}' overlaps '{existing.get('title')}'"
+                    for index, existing in conflicts[:3]
+                ),
+                next_actions=["choose_different_times", "view_schedule"]
+            )
+        
+        # Calendar inserts are independent, so issue them concurrently while
+        # capping how many are in flight to stay within Calendar API quotas
+        calendar_slots = asyncio.Semaphore(CALENDAR_CONCURRENCY_LIMIT)
+        
+        async def _create_calendar_event(event: Dict[str, Any], start_time: datetime, end_time: datetime) -> str:
+            async with calendar_slots:
+                return await google_services.create_calendar_event({
+                    "title": event["title"],
+                    "description": event.get("description", ""),
+                    "start_time": start_time,
+                    "end_time": end_time
+                })
+        
+        google_event_ids = await asyncio.gather(*(
+            _create_calendar_event(event, start_time, end_time)
+            for event, (start_time, end_time) in zip(events, intervals)
+        ))
+        
+        now = datetime.now()
+        writes = []
+        for event, (start_time, end_time), (start_ts, end_ts), google_event_id in zip(
+            events, intervals, timestamps, google_event_ids
+        ):
+            doc_ref = schedules_ref.document()
+            event_type = event["event_type"]
+            writes.append((doc_ref, {
+                "scheduleId": doc_ref.id,
+                "userId": user_id,
+                "title": event["title"],
+                "description": event.get("description", ""),
+                "type": event_type,
+                "category": _EVENT_CATEGORIES[event_type],
+                "googleEventId": google_event_id,
+                "scheduledTime": start_time,
+                "endTime": end_time,
+                "startTs": start_ts,
+                "endTs": end_ts,
+                "durationMinutes": event["duration_minutes"],
+                "frequency": event.get("frequency", "once"),
+                "status": "scheduled",
+                "createdAt": now,
+                "updatedAt": now
+            }))
+        
+        # Commit batches one at a time so a failure leaves a known prefix stored
+        committed = 0
+        try:
+            for offset in range(0, len(writes), FIRESTORE_BATCH_LIMIT):
+                await asyncio.to_thread(_commit_batch, db, writes[offset:offset + FIRESTORE_BATCH_LIMIT])
+                committed = min(offset + FIRESTORE_BATCH_LIMIT, len(writes))
+        except Exception as e:
+            logger.error(
+                "Bulk schedule write failed after %s of %s events for user %s: %s",
+                committed, len(writes), user_id, e
+            )
+            return SchedulingToolResult(
+                success=False,
+                data={
+                    "schedule_ids": [doc_ref.id for doc_ref, _ in writes[:committed]],
+                    "google_event_ids": list(google_event_ids[:committed]),
+                    "events_created": committed,
+                    # Calendar events whose schedule documents were not stored
+                    "uncommitted_google_event_ids": list(google_event_ids[committed:])
+                },
+                message=f"Scheduled {committed} of {len(writes)} events before a write failed",
+                error_details=str(e),
+                next_suggested_actions=["retry_remaining_events", "view_schedule"]
+            )
+        
+        schedule_ids = [doc_ref.id for doc_ref, _ in writes]
+        logger.info("Created %s schedule events for user %s", len(schedule_ids), user_id)
+        
+        return SchedulingToolResult.success_result(
+            data={
+                "schedule_ids": schedule_ids,
+                "google_event_ids": list(google_event_ids),
+                "events_created": len(schedule_ids)
+            },
+            message=f"Scheduled {len(schedule_ids)} events",
+            next_actions=["set_reminders", "view_schedule"]
+        )
+        
+    except Exception as e:
+        logger.error("Failed to create schedule events in bulk: %s", e)
+        return SchedulingToolResult.error_result(
+            message="Failed to create schedule events",
+            error_details=str(e)
+        )
+
+
+def _commit_batch(db: firestore.Client, writes: List[tuple]) -> None:
+    """Commit a list of (document reference, document) pairs as one batched write."""
+    batch = db.batch()
+    for doc_ref, doc in writes:
+        batch.set(doc_ref, doc)
+    batch.commit()
+
+
+def _get_overlapping_schedules(
+    schedules_ref: firestore.CollectionReference,
+    start_ts: int,
+    end_ts: int
+) -> List[Dict[str, Any]]:
+    """Read schedule documents overlapping [start_ts, end_ts).
+    
+    The query filters on scheduledTime/endTime rather than startTs/endTs so
+    that documents written before the epoch fields existed are matched too;
+    startTs/endTs are derived from the datetimes for every returned document.
+    
+    Args:
+        schedules_ref: The user's schedules collection
+        start_ts: Window start in epoch seconds
+        end_ts: Window end in epoch seconds
+        
+    Returns:
+        List of overlapping schedule documents, projected to the fields
+        conflict checks use
+    """
+    query = (
+        schedules_ref
+        .where(filter=FieldFilter("scheduledTime", "<", datetime.fromtimestamp(end_ts, timezone.utc)))
+        .where(filter=FieldFilter("endTime", ">", datetime.fromtimestamp(start_ts, timezone.utc)))
+        .select(["title", "scheduledTime", "endTime"])
+    )
+    schedules = _stream_dicts(query)
+    for schedule in schedules:
+        schedule["startTs"] = _to_epoch_seconds(schedule["scheduledTime"])
+        schedule["endTs"] = _to_epoch_seconds(schedule["endTime"])
+    return schedules
+
+
+def _stream_dicts(query) -> List[Dict[str, Any]]:
+    """Run a blocking Firestore query and return the documents as dicts."""
+    return [doc.to_dict() for doc in query.stream()]
+
+
+def _find_overlapping_events(intervals: List[tuple]) -> List[tuple]:
+    """Find new events that overlap an earlier-starting event in the same request.
+    
+    Args:
+        intervals: (start, end) epoch-second pairs for the new events
+        
+    Returns:
+        List of (earlier index, overlapping index) pairs
+    """
+    order = sorted(range(len(intervals)), key=lambda index: intervals[index][0])
+    overlaps = []
+    furthest = None  # (end, index) of the latest-ending event seen so far
+    for index in order:
+        start, end = intervals[index]
+        if furthest is not None and furthest[0] > start:
+            overlaps.append((furthest[1], index))
+        if furthest is None or end > furthest[0]:
+            furthest = (end, index)
+    return overlaps
+
+
+def _to_epoch_seconds(value: datetime) -> int:
+    """Convert a datetime to epoch seconds, treating naive values as UTC like Firestore does."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return int(value.timestamp())
+
+
+def _find_schedule_conflicts(
+    existing_events: List[Dict[str, Any]],
+    intervals: List[tuple]
+) -> List[tuple]:
+    """Find which candidate intervals overlap an existing scheduled event.
+    
+    Existing events are sorted by start once, with a running maximum of their
+    end times. An event overlaps a candidate only if it starts before the
+    candidate ends, so a single bisect plus one comparison against the furthest
+    end among those events decides each candidate in O(log M).
+    
+    Args:
+        existing_events: Schedule documents with startTs and endTs epoch seconds
+        intervals: Candidate (start, end) pairs in epoch seconds
+        
+    Returns:
+        List of (candidate index, conflicting schedule document) pairs
+    """
+    existing = sorted((
+        (doc["startTs"], doc["endTs"], doc)
+        for doc in existing_events
+        if doc.get("startTs") is not None and doc.get("endTs") is not None
+    ), key=lambda item: item[0])
+    starts = [start for start, _, _ in existing]
+    
+    # furthest[i] is the document with the latest end among existing[:i + 1]
+    furthest = []
+    for _, end, doc in existing:
+        if not furthest or end > furthest[-1][0]:
+            furthest.append((end, doc))
+        else:
+            furthest.append(furthest[-1])
+    
+    conflicts = []
+    for index, (start, end) in enumerate(intervals):
+        count = bisect_left(starts, end)
+        if count and furthest[count - 1][0] > start:
+            conflicts.append((index, furthest[count - 1][1]))
+    
+    return conflicts
+
+
 # ============================================================================
 # NUTRITION TOOLS (Mock implementation)
 # ============================================================================
@@ -342,35 +686,37 @@ async def analyze_food_image(
         analysis_result = await google_services.analyze_food_image(image_data)
         
         # Get today's date for daily calorie tracking
-        today_date = datetime.now().strftime("%Y-%m-%d")
+        now = datetime.now()
+        today_date = now.date().isoformat()
         
         # Store/update daily calories in Firestore
-        db = firestore.Client()
+        db = get_firestore_client()
         daily_calories_ref = db.collection("users").document(user_id).collection("nutrition").document("dailyCalories").collection(today_date).document("total")
         
         # Get current daily total
-        daily_doc = daily_calories_ref.get()
+        daily_doc = await asyncio.to_thread(daily_calories_ref.get)
         current_total = daily_doc.to_dict().get("totalCalories", 0) if daily_doc.exists else 0
         
         # Add new calories
         new_total = current_total + analysis_result["estimated_calories"]
         
         # Update daily calories
+        now_iso = now.isoformat()
         daily_data = {
             "totalCalories": new_total,
-            "lastUpdated": datetime.now().isoformat(),
+            "lastUpdated": now_iso,
             "meals": firestore.ArrayUnion([{
                 "mealType": meal_type,
                 "calories": analysis_result["estimated_calories"],
                 "foods": analysis_result["detected_foods"],
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": now_iso,
                 "confidence": analysis_result["confidence"]
             }])
         }
         
-        daily_calories_ref.set(daily_data, merge=True)
+        await asyncio.to_thread(daily_calories_ref.set, daily_data, merge=True)
         
-        logger.info(f"Food analysis completed for user {user_id}: {analysis_result['estimated_calories']} calories")
+        logger.info("Food analysis completed for user %s: %s calories", user_id, analysis_result['estimated_calories'])
         
         return NutritionToolResult.success_result(
             data={
@@ -390,7 +736,7 @@ async def analyze_food_image(
         )
         
     except Exception as e:
-        logger.error(f"Failed to analyze food image: {e}")
+        logger.error("Failed to analyze food image: %s", e)
         return NutritionToolResult.error_result(
             message="Failed to analyze food image",
             error_details=str(e)
@@ -407,26 +753,28 @@ async def reset_daily_calories(user_id: str) -> NutritionToolResult:
         NutritionToolResult with reset confirmation
     """
     try:
-        today_date = datetime.now().strftime("%Y-%m-%d")
+        now = datetime.now()
+        today_date = now.date().isoformat()
         
         # Reset today's calories in Firestore
-        db = firestore.Client()
+        db = get_firestore_client()
         daily_calories_ref = db.collection("users").document(user_id).collection("nutrition").document("dailyCalories").collection(today_date).document("total")
         
+        now_iso = now.isoformat()
         reset_data = {
             "totalCalories": 0,
-            "lastReset": datetime.now().isoformat(),
+            "lastReset": now_iso,
             "meals": []
         }
         
-        daily_calories_ref.set(reset_data)
+        await asyncio.to_thread(daily_calories_ref.set, reset_data)
         
-        logger.info(f"Daily calories reset for user {user_id}")
+        logger.info("Daily calories reset for user %s", user_id)
         
         return NutritionToolResult.success_result(
             data={
                 "reset_date": today_date,
-                "reset_time": datetime.now().isoformat()
+                "reset_time": now_iso
             },
             message="Daily calorie counter reset to 0",
             daily_calories=0,
@@ -434,7 +782,7 @@ async def reset_daily_calories(user_id: str) -> NutritionToolResult:
         )
         
     except Exception as e:
-        logger.error(f"Failed to reset daily calories: {e}")
+        logger.error("Failed to reset daily calories: %s", e)
         return NutritionToolResult.error_result(
             message="Failed to reset daily calories",
             error_details=str(e)
@@ -464,7 +812,7 @@ async def transcribe_audio_input(
         # Use Google Speech-to-Text
         transcript = await google_services.transcribe_audio(audio_data, language_code)
         
-        logger.info(f"Audio transcribed successfully for context: {context}")
+        logger.info("Audio transcribed successfully for context: %s", context)
         
         return {
             "success": True,
@@ -476,7 +824,7 @@ async def transcribe_audio_input(
         }
         
     except Exception as e:
-        logger.error(f"Failed to transcribe audio: {e}")
+        logger.error("Failed to transcribe audio: %s", e)
         return {
             "success": False,
             "error": str(e),
@@ -507,7 +855,7 @@ async def get_google_services_status() -> Dict[str, Any]:
         }
         
     except Exception as e:
-        logger.error(f"Failed to get services status: {e}")
+        logger.error("Failed to get services status: %s", e)
         return {
             "error": str(e),
             "timestamp": datetime.now().isoformat()
@@ -524,36 +872,39 @@ async def get_user_phase1_summary(user_id: str) -> Dict[str, Any]:
         Dictionary with comprehensive user data
     """
     try:
-        db = firestore.Client()
+        db = get_firestore_client()
         
-        # Get exercise data
+        # Exercise and schedule data
         exercises_ref = db.collection("users").document(user_id).collection("exercises")
-        exercises = [doc.to_dict() for doc in exercises_ref.stream()]
-        
-        # Get schedule data
         schedules_ref = db.collection("users").document(user_id).collection("schedules")
-        schedules = [doc.to_dict() for doc in schedules_ref.stream()]
         
-        # Get nutrition data (today)
-        today_date = datetime.now().strftime("%Y-%m-%d")
+        # Nutrition data (today)
+        now = datetime.now()
+        today_date = now.date().isoformat()
         nutrition_ref = db.collection("users").document(user_id).collection("nutrition").document("dailyCalories").collection(today_date).document("total")
-        nutrition_doc = nutrition_ref.get()
-        nutrition_data = nutrition_doc.to_dict() if nutrition_doc.exists else {"totalCalories": 0}
         
-        # Get session timers
+        # Session timers
         timers_ref = db.collection("users").document(user_id).collection("sessionTimers")
-        timers = [doc.to_dict() for doc in timers_ref.stream()]
+        recent_timers_query = timers_ref.order_by("startTime", direction=firestore.Query.DESCENDING).limit(3)
+        
+        # The reads are independent, so issue them concurrently off the event loop
+        exercise_summary, schedules, nutrition_doc, timer_count, recent_timers = await asyncio.gather(
+            asyncio.to_thread(_summarize_exercises, exercises_ref),
+            asyncio.to_thread(_stream_dicts, schedules_ref),
+            asyncio.to_thread(nutrition_ref.get),
+            asyncio.to_thread(timers_ref.count(alias="total").get),
+            asyncio.to_thread(_stream_dicts, recent_timers_query)
+        )
+        nutrition_data = nutrition_doc.to_dict() if nutrition_doc.exists else {"totalCalories": 0}
+        total_timers = timer_count[0][0].value
+        recent_timers.reverse()
         
         summary = {
             "user_id": user_id,
-            "exercises": {
-                "total_sessions": len(exercises),
-                "recent_exercises": exercises[-5:] if exercises else [],
-                "average_effectiveness": sum(ex.get("effectivenessScore", 0) for ex in exercises if ex.get("effectivenessScore")) / len(exercises) if exercises else 0
-            },
+            "exercises": exercise_summary,
             "schedules": {
                 "total_events": len(schedules),
-                "upcoming_events": [s for s in schedules if s.get("scheduledTime") and s["scheduledTime"] > datetime.now()],
+                "upcoming_events": [s for s in schedules if s.get("scheduledTime") and s["scheduledTime"] > now],
                 "wellness_events": [s for s in schedules if s.get("category") == "wellness"]
             },
             "nutrition": {
@@ -561,16 +912,16 @@ async def get_user_phase1_summary(user_id: str) -> Dict[str, Any]:
                 "meals_today": len(nutrition_data.get("meals", []))
             },
             "session_timers": {
-                "total_sessions": len(timers),
-                "recent_sessions": timers[-3:] if timers else []
+                "total_sessions": total_timers,
+                "recent_sessions": recent_timers
             },
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now.isoformat()
         }
         
         return summary
         
     except Exception as e:
-        logger.error(f"Failed to get user Phase 1 summary: {e}")
+        logger.error("Failed to get user Phase 1 summary: %s", e)
         return {
             "error": str(e),
             "user_id": user_id,
@@ -15,6 +15,7 @@ from enum import Enum
 import uuid
 
 from .tool_results import TimerToolResult
+from .firestore_client import get_firestore_client
 
 
 class SessionType(Enum):
@@ -137,27 +138,27 @@ class TherapyPhaseCallbacks:
     async def on_pre_session_start(self, session_data: SessionData):
         """2 min (or 1 min for short): Load context, prepare materials."""
         duration = 2 if session_data.therapy_session_type == "standard_60" else 1
-        self.logger.info(f"PRE-SESSION phase started - Duration: {duration} minutes")
+        self.logger.info("PRE-SESSION phase started - Duration: %s minutes", duration)
         
     async def on_opening_start(self, session_data: SessionData):
         """6 min (or 3 min for short): Mood assessment, check-in."""
         duration = 6 if session_data.therapy_session_type == "standard_60" else 3
-        self.logger.info(f"OPENING phase started - Duration: {duration} minutes")
+        self.logger.info("OPENING phase started - Duration: %s minutes", duration)
         
     async def on_working_start(self, session_data: SessionData):
         """40 min (or 20 min for short): Main therapeutic work."""
         duration = 40 if session_data.therapy_session_type == "standard_60" else 20
-        self.logger.info(f"WORKING phase started - Duration: {duration} minutes")
+        self.logger.info("WORKING phase started - Duration: %s minutes", duration)
         
     async def on_integration_start(self, session_data: SessionData):
         """6 min (or 3 min for short): Empowerment insights, reflection."""
         duration = 6 if session_data.therapy_session_type == "standard_60" else 3
-        self.logger.info(f"INTEGRATION phase started - Duration: {duration} minutes")
+        self.logger.info("INTEGRATION phase started - Duration: %s minutes", duration)
         
     async def on_closing_start(self, session_data: SessionData):
         """6 min (or 3 min for short): Summary, homework, scheduling."""
         duration = 6 if session_data.therapy_session_type == "standard_60" else 3
-        self.logger.info(f"CLOSING phase started - Duration: {duration} minutes")
+        self.logger.info("CLOSING phase started - Duration: %s minutes", duration)
 
 
 class EnhancedSessionTimer:
@@ -196,8 +197,10 @@ class EnhancedSessionTimer:
         self._update_interval = 1.0  # Update every second
         
         total = self.session_data.total_duration_minutes
-        self.logger.info(f"Enhanced SessionTimer initialized: {session_type.value} "
-                        f"({therapy_session_type if session_type == SessionType.THERAPY else 'exercise'}) - {total} minutes")
+        self.logger.info("Enhanced SessionTimer initialized: %s (%s) - %s minutes",
+                         session_type.value,
+                         therapy_session_type if session_type == SessionType.THERAPY else 'exercise',
+                         total)
     
     def _create_session_data(self) -> SessionData:
         """Create session data with exact phase timing based on session type."""
@@ -287,7 +290,7 @@ class EnhancedSessionTimer:
         self._timer_task = asyncio.create_task(self._timer_loop())
         
         session_type_display = self.therapy_session_type if self.session_type == SessionType.THERAPY else "exercise"
-        self.logger.info(f"Enhanced session {self.session_data.session_id} started: {session_type_display}")
+        self.logger.info("Enhanced session %s started: %s", self.session_data.session_id, session_type_display)
         
         return TimerToolResult(
             success=True,
@@ -450,7 +453,7 @@ class EnhancedSessionTimer:
         except asyncio.CancelledError:
             self.logger.info("Enhanced timer loop cancelled")
         except Exception as e:
-            self.logger.error(f"Enhanced timer loop error: {e}")
+            self.logger.error("Enhanced timer loop error: %s", e)
     
     async def _check_phase_transitions_exact(self, current_time: float):
         """Check for automatic phase transitions at exact times."""
@@ -493,9 +496,9 @@ class EnhancedSessionTimer:
             "status": "completed"
         })
         
-        self.logger.info(f"Phase completed: {current_phase.name} "
-                        f"(planned: {current_phase.duration_minutes}min, "
-                        f"actual: {current_phase.actual_duration/60:.1f}min)")
+        self.logger.info("Phase completed: %s (planned: %smin, actual: %.1fmin)",
+                         current_phase.name, current_phase.duration_minutes,
+                         current_phase.actual_duration / 60)
         
         # Move to next phase
         self.session_data.current_phase_index += 1
@@ -515,7 +518,7 @@ class EnhancedSessionTimer:
                     callback = getattr(self.phase_callbacks, callback_name)
                     await callback(self.session_data)
             
-            self.logger.info(f"Phase started: {next_phase.name} ({next_phase.duration_minutes} minutes)")
+            self.logger.info("Phase started: %s (%s minutes)", next_phase.name, next_phase.duration_minutes)
         else:
             # All phases complete
             await self.complete_session()
@@ -543,16 +546,16 @@ class EnhancedSessionTimer:
             if current_phase:
                 sync_data["currentPhaseRemaining"] = current_phase.remaining_seconds
             
-            self.logger.debug(f"Firebase sync {'(FINAL)' if final else ''}: "
-                             f"{sync_data['totalElapsed']}s elapsed, "
-                             f"phase: {sync_data['currentPhase']}")
+            self.logger.debug("Firebase sync %s: %ss elapsed, phase: %s",
+                              '(FINAL)' if final else '',
+                              sync_data['totalElapsed'], sync_data['currentPhase'])
             
             # TODO: Replace with actual Firestore implementation
             # await firestore_client.collection('users').document(self.user_id)\
             #     .collection('sessionTimers').document(self.session_data.session_id).set(sync_data)
             
         except Exception as e:
-            self.logger.error(f"Firebase sync error: {e}")
+            self.logger.error("Firebase sync error: %s", e)
     
     def _update_session_progress(self, current_time: float, elapsed_time: float):
         """Update session progress and completion percentage."""
@@ -606,7 +609,7 @@ class EnhancedSessionTimer:
             next_phase.status = PhaseStatus.ACTIVE
             next_phase.start_time = time.time()
             
-            self.logger.info(f"Transitioned to phase: {next_phase.name}")
+            self.logger.info("Transitioned to phase: %s", next_phase.name)
             return {
                 "success": True,
                 "current_phase": next_phase.name,
@@ -645,7 +648,7 @@ class EnhancedSessionTimer:
             prev_phase.status = PhaseStatus.ACTIVE
             prev_phase.start_time = time.time()
             
-            self.logger.info(f"Moved back to phase: {prev_phase.name}")
+            self.logger.info("Moved back to phase: %s", prev_phase.name)
             return {
                 "success": True,
                 "current_phase": prev_phase.name,
@@ -665,7 +668,7 @@ class EnhancedSessionTimer:
         if self._timer_task:
             self._timer_task.cancel()
         
-        self.logger.info(f"Session {self.session_data.session_id} paused")
+        self.logger.info("Session %s paused", self.session_data.session_id)
         return {"success": True, "message": "Session paused"}
     
     async def resume_session(self) -> Dict[str, Any]:
@@ -699,7 +702,7 @@ class EnhancedSessionTimer:
         # Restart timer task
         self._timer_task = asyncio.create_task(self._timer_loop())
         
-        self.logger.info(f"Session {self.session_data.session_id} resumed")
+        self.logger.info("Session %s resumed", self.session_data.session_id)
         return {"success": True, "message": "Session resumed"}
     
     async def complete_session(self, user_notes: Optional[str] = None) -> TimerToolResult:
@@ -739,7 +742,7 @@ class EnhancedSessionTimer:
         # Store final results in Firestore
         firestore_result = await self._store_session_results()
         
-        self.logger.info(f"Session {self.session_data.session_id} completed")
+        self.logger.info("Session %s completed", self.session_data.session_id)
         
         # Return structured result
         return TimerToolResult.success_result(
@@ -771,10 +774,8 @@ class EnhancedSessionTimer:
             True if successful, False otherwise
         """
         try:
-            from google.cloud import firestore
-            
-            # Get Firestore client
-            db = firestore.Client()
+            # Get the shared Firestore client
+            db = get_firestore_client()
             
             # Prepare session document for Firestore
             session_doc = {
@@ -805,14 +806,15 @@ class EnhancedSessionTimer:
                 "updatedAt": datetime.now().isoformat()
             }
             
-            # Store in Firestore
-            db.collection("users").document(self.user_id).collection("sessionTimers").document(self.session_data.session_id).set(session_doc)
+            # Store in Firestore without blocking the event loop
+            doc_ref = db.collection("users").document(self.user_id).collection("sessionTimers").document(self.session_data.session_id)
+            await asyncio.to_thread(doc_ref.set, session_doc)
             
-            self.logger.info(f"Session results stored in Firestore: {self.session_data.session_id}")
+            self.logger.info("Session results stored in Firestore: %s", self.session_data.session_id)
             return True
             
         except Exception as e:
-            self.logger.error(f"Failed to store session results: {e}")
+            self.logger.error("Failed to store session results: %s", e)
             return False
     
     async def _send_update(self):
@@ -830,7 +832,7 @@ class EnhancedSessionTimer:
             try:
                 await self.callback_fn(update_data)
             except Exception as e:
-                self.logger.error(f"Callback function error: {e}")
+                self.logger.error("Callback function error: %s", e)
     
     # Utility Methods
     def get_current_phase(self) -> Optional[SessionPhase]:
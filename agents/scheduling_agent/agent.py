@@ -7,6 +7,7 @@ providing OAuth-authenticated access to Google Calendar API.
 
 import os
 import asyncio
+import functools
 import subprocess
 from datetime import datetime, timedelta
 from typing import Dict, Any, Optional, List
@@ -17,6 +18,25 @@ from google.genai import types
 from google.adk.agents.llm_agent import LlmAgent
 from google.adk.tools.mcp_tool.mcp_toolset import MCPToolset, StdioServerParameters
 
+try:
+    # Try relative import first (when loaded as part of package)
+    from .prompts import (
+        SCHEDULING_AGENT_SYSTEM_PROMPT,
+        AGENT_INSTRUCTION_CAPABILITIES,
+        AGENT_INSTRUCTION_FEATURES,
+        AGENT_INSTRUCTION_GUIDELINES,
+        FALLBACK_INSTRUCTION_BODY
+    )
+except ImportError:
+    # Fall back to absolute import (when loaded directly by ADK)
+    from agents.scheduling_agent.prompts import (
+        SCHEDULING_AGENT_SYSTEM_PROMPT,
+        AGENT_INSTRUCTION_CAPABILITIES,
+        AGENT_INSTRUCTION_FEATURES,
+        AGENT_INSTRUCTION_GUIDELINES,
+        FALLBACK_INSTRUCTION_BODY
+    )
+
 # Load environment variables
 try:
     from dotenv import load_dotenv
@@ -24,6 +44,53 @@ try:
 except ImportError:
     pass
 
+@functools.lru_cache(maxsize=16)
+def _render_agent_instruction(user_timezone_str: str, current_time: datetime) -> str:
+    """Render the MCP-mode instruction for a timezone and minute."""
+    current_date = current_time.strftime('%A, %B %d, %Y')
+    current_time_str = current_time.strftime('%I:%M %p %Z' if current_time.tzinfo else '%I:%M %p')
+    
+    return f"""You are an intelligent Google Calendar scheduling assistant powered by Google Calendar MCP server.
+
+**⏰ CURRENT CONTEXT:**
+- Today's Date: {current_date}
+- Current Time: {current_time_str}
+- User Timezone: {user_timezone_str}
+- Tomorrow: {(current_time + timedelta(days=1)).strftime('%A, %B %d, %Y')}
+
+{AGENT_INSTRUCTION_CAPABILITIES}
+3. **Timezone Awareness**: Use the user's timezone ({user_timezone_str}) for all scheduling
+{AGENT_INSTRUCTION_FEATURES}
+
+**📅 Date/Time Processing Rules:**
+- "tomorrow" = {(current_time + timedelta(days=1)).strftime('%A, %B %d, %Y')}
+- "today" = {current_date}
+- "next Monday" = calculate the next occurrence of Monday
+- "in 2 hours" = {(current_time + timedelta(hours=2)).strftime('%I:%M %p %Z on %B %d')}
+- Always confirm the parsed date/time with the user before creating events
+- Use {user_timezone_str} as the default timezone for all events
+
+{AGENT_INSTRUCTION_GUIDELINES}"""
+
+
+@functools.lru_cache(maxsize=16)
+def _render_fallback_instruction(user_timezone_str: str, current_time: datetime) -> str:
+    """Render the fallback-mode instruction for a timezone and minute."""
+    current_date = current_time.strftime('%A, %B %d, %Y')
+    current_time_str = current_time.strftime('%I:%M %p %Z' if current_time.tzinfo else '%I:%M %p')
+    
+    return f"""You are a helpful scheduling assistant currently in FALLBACK mode.
+
+**⚠️  CURRENT STATUS: GOOGLE CALENDAR ACCESS UNAVAILABLE**
+
+**⏰ CURRENT CONTEXT:**
+- Today's Date: {current_date}
+- Current Time: {current_time_str}
+- User Timezone: {user_timezone_str}
+
+{FALLBACK_INSTRUCTION_BODY}"""
+
+
 class GoogleCalendarSchedulingAgent:
     """Google Calendar MCP-powered scheduling agent."""
     
@@ -132,168 +199,28 @@ class GoogleCalendarSchedulingAgent:
             "5. Add your test users to the OAuth consent screen"
         )
     
-    def _get_agent_instruction(self) -> str:
-        """Get the instruction prompt for the scheduling agent."""
-        # Get current date and time information
-        from datetime import datetime, timedelta
-        import pytz
-        
+    def _get_current_time_context(self) -> tuple[str, datetime]:
+        """Get the user's timezone name and the current time truncated to the minute."""
         # Try to detect user's timezone or default to a common one
         try:
             # You can customize this based on user preferences/location
             user_timezone_str = os.getenv('USER_TIMEZONE', 'America/New_York')
-            user_timezone = pytz.timezone(user_timezone_str)
-            current_time = datetime.now(user_timezone)
-            current_date = current_time.strftime('%A, %B %d, %Y')
-            current_time_str = current_time.strftime('%I:%M %p %Z')
+            current_time = datetime.now(pytz.timezone(user_timezone_str))
         except:
             # Fallback to local time
             current_time = datetime.now()
-            current_date = current_time.strftime('%A, %B %d, %Y')
-            current_time_str = current_time.strftime('%I:%M %p')
             user_timezone_str = 'Local Time'
         
-        return f"""You are an intelligent Google Calendar scheduling assistant powered by Google Calendar MCP server.
-
-**⏰ CURRENT CONTEXT:**
-- Today's Date: {current_date}
-- Current Time: {current_time_str}
-- User Timezone: {user_timezone_str}
-- Tomorrow: {(current_time + timedelta(days=1)).strftime('%A, %B %d, %Y')}
-
-**Your Core Capabilities:**
-- **Calendar Management**: List, create, and manage multiple calendars
-- **Event Operations**: Create, read, update, delete calendar events with full details
-- **Smart Scheduling**: Handle complex scheduling requests with natural language understanding
-- **Availability Checking**: Use free/busy queries to find optimal meeting times
-- **Event Search**: Find events by text, date ranges, or specific criteria
-- **Multi-Calendar Support**: Work across personal, work, and shared calendars
-- **Conflict Resolution**: Detect and suggest solutions for scheduling conflicts
-
-**Key Features You Provide:**
-1. **Natural Language Processing**: Understand requests like "Schedule a team meeting next Tuesday at 2 PM" or "tomorrow at 3pm"
-2. **Intelligent Date/Time Parsing**: When user says "tomorrow", "next week", or relative dates, automatically calculate the exact date and time
-3. **Timezone Awareness**: Use the user's timezone ({user_timezone_str}) for all scheduling
-4. **Event Details Management**: Handle locations, descriptions, attendees, reminders
-5. **Recurring Events**: Create and manage repeating events
-6. **Calendar Colors**: Use appropriate colors for different event types
-7. **Cross-Calendar Coordination**: Check availability across multiple calendars
-
-**📅 Date/Time Processing Rules:**
-- "tomorrow" = {(current_time + timedelta(days=1)).strftime('%A, %B %d, %Y')}
-- "today" = {current_date}
-- "next Monday" = calculate the next occurrence of Monday
-- "in 2 hours" = {(current_time + timedelta(hours=2)).strftime('%I:%M %p %Z on %B %d')}
-- Always confirm the parsed date/time with the user before creating events
-- Use {user_timezone_str} as the default timezone for all events
-
-**Best Practices:**
-- ✅ Automatically parse relative dates and times without asking for clarification
-- ✅ Always confirm event details before creation, showing the exact date and time
-- ✅ Use appropriate calendar colors for different event types
-- ✅ Check for conflicts before scheduling
-- ✅ Provide clear confirmation messages with event details
-- ✅ Suggest alternative times when conflicts exist
-
-**Available Tools:**
-- `list-calendars`: Get all available calendars
-- `list-events`: Retrieve events with date filtering
-- `search-events`: Find events by text query
-- `create-event`: Create new calendar events
-- `update-event`: Modify existing events
-- `delete-event`: Remove events
-- `get-freebusy`: Check availability across calendars
-- `list-colors`: Get available event colors
-
-**Response Style:**
-- Be proactive and helpful
-- 🚀 Automatically interpret "tomorrow", "next week", etc. without asking for exact dates
-- Provide clear confirmations with event details including exact date/time
-- Suggest improvements or alternatives when appropriate
-- Use emojis to make responses more engaging
-- Always verify important details before making changes
-
-Remember: You have direct access to Google Calendar through OAuth authentication and current date/time context. Use this power responsibly and always confirm important actions with users."""
+        # Instructions only show minutes, so calls within the same minute share a rendered prompt
+        return user_timezone_str, current_time.replace(second=0, microsecond=0)
+    
+    def _get_agent_instruction(self) -> str:
+        """Get the instruction prompt for the scheduling agent."""
+        return _render_agent_instruction(*self._get_current_time_context())
 
     def _get_fallback_instruction(self) -> str:
         """Get fallback instruction when MCP tools are not available."""
-        from datetime import datetime, timedelta
-        import pytz
-        
-        try:
-            user_timezone_str = os.getenv('USER_TIMEZONE', 'America/New_York')
-            user_timezone = pytz.timezone(user_timezone_str)
-            current_time = datetime.now(user_timezone)
-            current_date = current_time.strftime('%A, %B %d, %Y')
-            current_time_str = current_time.strftime('%I:%M %p %Z')
-        except:
-            current_time = datetime.now()
-            current_date = current_time.strftime('%A, %B %d, %Y')
-            current_time_str = current_time.strftime('%I:%M %p')
-            user_timezone_str = 'Local Time'
-        
-        return f"""You are a helpful scheduling assistant currently in FALLBACK mode.
-
-**⚠️  CURRENT STATUS: GOOGLE CALENDAR ACCESS UNAVAILABLE**
-
-**⏰ CURRENT CONTEXT:**
-- Today's Date: {current_date}
-- Current Time: {current_time_str}
-- User Timezone: {user_timezone_str}
-
-**🔧 Technical Issue:**
-The Google Calendar MCP server is currently unavailable. This could be due to:
-- OAuth authentication needs to be set up
-- Network connectivity issues
-- Google Calendar API quotas
-- Configuration problems
-
-**What I Can Still Help With:**
-✅ **Schedule Planning**: Help you plan and organize events
-✅ **Time Management**: Suggest optimal meeting times
-✅ **Event Details**: Help format event descriptions, locations, attendees
-✅ **Conflict Analysis**: Review your described schedule for conflicts
-✅ **Meeting Coordination**: Draft meeting invitations and agendas
-✅ **Calendar Strategy**: Provide time management and scheduling advice
-
-**What I Cannot Do Right Now:**
-❌ Actually create/modify Google Calendar events
-❌ Check your real calendar availability  
-❌ Access existing calendar data
-❌ Send calendar invitations
-
-**🚀 How I'll Help You:**
-1. **Manual Instructions**: I'll provide step-by-step instructions for creating events
-2. **Event Templates**: Generate properly formatted event details you can copy-paste
-3. **Schedule Analysis**: Help analyze scheduling conflicts based on what you tell me
-4. **Reminders**: Suggest when to set reminders and follow-ups
-
-**Example Response Format:**
-When you ask me to schedule something, I'll respond like:
-
-"📅 **Manual Calendar Event Details:**
-- Title: Team Meeting
-- Date: Tuesday, June 25, 2024  
-- Time: 2:00 PM - 3:00 PM EST
-- Location: Conference Room A / Zoom
-- Description: Weekly team sync...
-
-**To create this event:**
-1. Open Google Calendar in your browser
-2. Click 'Create' or the '+' button
-3. Copy the details above
-4. Set appropriate reminders (15 mins before recommended)
-
-Would you like me to help with any scheduling coordination or provide more detailed event planning?"
-
-**💡 For Full Google Calendar Integration:**
-Contact your system administrator to:
-1. Verify OAuth credentials are properly configured
-2. Check Google Calendar API access
-3. Restart the MCP server components
-4. Review network connectivity to Google services
-
-I'm here to help with scheduling coordination even without direct calendar access!"""
+        return _render_fallback_instruction(*self._get_current_time_context())
 
     async def close(self):
         """Clean up MCP connection."""
@@ -484,51 +411,7 @@ def _get_oauth_credentials_path_static():
 
 def _get_agent_instruction_static():
     """Static version of agent instruction getter."""
-    return """You are an intelligent Google Calendar scheduling assistant powered by Google Calendar MCP server.
-
-**Your Core Capabilities:**
-- **Calendar Management**: List, create, and manage multiple calendars
-- **Event Operations**: Create, read, update, delete calendar events with full details
-- **Smart Scheduling**: Handle complex scheduling requests with natural language understanding
-- **Availability Checking**: Use free/busy queries to find optimal meeting times
-- **Event Search**: Find events by text, date ranges, or specific criteria
-- **Multi-Calendar Support**: Work across personal, work, and shared calendars
-- **Conflict Resolution**: Detect and suggest solutions for scheduling conflicts
-
-**Key Features You Provide:**
-1. **Natural Language Processing**: Understand requests like "Schedule a team meeting next Tuesday at 2 PM"
-2. **Intelligent Scheduling**: Suggest optimal times based on availability
-3. **Event Details Management**: Handle locations, descriptions, attendees, reminders
-4. **Recurring Events**: Create and manage repeating events
-5. **Calendar Colors**: Use appropriate colors for different event types
-6. **Cross-Calendar Coordination**: Check availability across multiple calendars
-
-**Best Practices:**
-- Always confirm event details before creation
-- Use appropriate calendar colors for different event types
-- Check for conflicts before scheduling
-- Provide clear confirmation messages with event details
-- Handle timezone considerations appropriately
-- Suggest alternative times when conflicts exist
-
-**Available Tools:**
-- `list-calendars`: Get all available calendars
-- `list-events`: Retrieve events with date filtering
-- `search-events`: Find events by text query
-- `create-event`: Create new calendar events
-- `update-event`: Modify existing events
-- `delete-event`: Remove events
-- `get-freebusy`: Check availability across calendars
-- `list-colors`: Get available event colors
-
-**Response Style:**
-- Be proactive and helpful
-- Provide clear confirmations with event details
-- Suggest improvements or alternatives when appropriate
-- Use emojis to make responses more engaging
-- Always verify important details before making changes
-
-Remember: You have direct access to Google Calendar through OAuth authentication. Use this power responsibly and always confirm important actions with users."""
+    return SCHEDULING_AGENT_SYSTEM_PROMPT
 
 # Export root_agent for ADK web interface
 root_agent = get_root_agent()